@@ -1,9 +1,46 @@
-import re
+import json
+import os
+import sys
+from collections import namedtuple
 import pandas as pd
+import matplotlib
+# Sans affichage (serveur, SSH), utiliser le backend Agg non interactif
+if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.ticker import FixedLocator, FuncFormatter, MultipleLocator
 import numpy as np
 from pathlib import Path
 import seaborn as sns
+from solverLogParser import COLUMNS, RESULTS, SOLVERS, SolverLogParser
+
+try:
+    # Optionnel: rendu en image de densité pour les très grands nuages de points
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:
+    ds = None
+
+
+# Au-delà de ce nombre de points, les marqueurs sont dessinés sans bordure
+_LARGE_SCATTER = 1000
+# Au-delà de ce nombre de points, agrégation en image de densité (si datashader)
+_DENSITY_SCATTER = 5000
+# Résolution des figures sauvegardées (4x moins de pixels qu'à 300, lisible à l'écran)
+_SAVE_DPI = 150
+
+# Version du format du cache Parquet: à incrémenter à chaque changement de la
+# sortie de create_dataframe (colonnes, types), pour invalider les anciens caches
+_CACHE_FORMAT = 1
+
+# Colonnes des instances résolues par CDCL, extraites une fois en tableaux numpy
+_PlotArrays = namedtuple('_PlotArrays', [
+    'vars_', 'clauses', 'time_', 'nodes', 'ratio', 'is_sat', 'is_unsat', 'has_nodes'
+])
+
+# Catégories de taille (variables): intervalles (0, 50], (50, 100], ..., (200, 300]
+_SIZE_EDGES = np.array([0, 50, 100, 150, 200, 300])
+_SIZE_LABELS = ['<50', '50-100', '100-150', '150-200', '>200']
 
 class SATSolverResultsAnalyzer:
     """
@@ -11,108 +48,116 @@ class SATSolverResultsAnalyzer:
     Génère des graphiques de comparaison et un fichier CSV
     """
     
-    def __init__(self, results_file):
+    def __init__(self, results_file, verbose=True):
         self.results_file = results_file
-        self.results = []
+        # verbose=False: pas d'aperçu du DataFrame (formatage coûteux)
+        self.verbose = verbose
+        # Parsing délégué au module léger (importable par les processus fils)
+        self.parser = SolverLogParser(results_file)
+        self.results = self.parser.results
         self.df = None
+        self.masks = None
+        self._df_built = False
     
-    def parse_results(self):
-        """Parser le fichier texte de résultats"""
+    def parse_results(self, workers=1):
+        """
+        Parser le fichier texte de résultats (en série par défaut).
+        workers > 1 (None: tous les cœurs) parallélise les très gros logs,
+        voir SolverLogParser.parse.
+        """
         print("🔍 Parsing du fichier de résultats...")
         
-        with open(self.results_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Pattern pour extraire les informations de chaque instance
-        pattern = r'Fichier: (.+?\.cnf)\s*-+\s*Variables: (\d+) \| Clauses: (\d+)\s*\n\[1/3\] NAIVE\.\.\.\s*(.+?)\s*\n\[2/3\] MOMS\.\.\.\s*(.+?)\s*\n\[3/3\] CDCL\.\.\.\s*(.+?)(?=\n\n|$)'
-        
-        matches = re.finditer(pattern, content, re.DOTALL)
-        
-        for match in matches:
-            filename = match.group(1).strip()
-            num_vars = int(match.group(2))
-            num_clauses = int(match.group(3))
-            naive_result = match.group(4).strip()
-            moms_result = match.group(5).strip()
-            cdcl_result = match.group(6).strip()
-            
-            # Parser NAIVE
-            naive_data = self._parse_solver_result(naive_result)
-            
-            # Parser MOMS
-            moms_data = self._parse_solver_result(moms_result)
-            
-            # Parser CDCL
-            cdcl_data = self._parse_solver_result(cdcl_result)
-            
-            # Créer l'entrée
-            entry = {
-                'filename': Path(filename).name,
-                'variables': num_vars,
-                'clauses': num_clauses,
-                'ratio_clauses_vars': num_clauses / num_vars if num_vars > 0 else 0,
-                
-                # NAIVE
-                'naive_result': naive_data['result'],
-                'naive_time': naive_data['time'],
-                'naive_nodes': naive_data['nodes'],
-                
-                # MOMS
-                'moms_result': moms_data['result'],
-                'moms_time': moms_data['time'],
-                'moms_nodes': moms_data['nodes'],
-                
-                # CDCL
-                'cdcl_result': cdcl_data['result'],
-                'cdcl_time': cdcl_data['time'],
-                'cdcl_nodes': cdcl_data['nodes']
-            }
-            
-            self.results.append(entry)
-        
-        print(f"✓ {len(self.results)} instances analysées")
+        self.parser.parse(workers)
+        
+        print(f"✓ {len(self.results['filename'])} instances analysées")
         return self.results
     
-    def _parse_solver_result(self, result_str):
-        """Parser un résultat individuel (SAT/UNSAT/TIMEOUT)"""
+    def create_dataframe(self):
+        """Créer un DataFrame pandas (construit une seule fois)"""
+        if self._df_built:
+            return self.df
+        
+        cols = self.results
+        variables = np.asarray(cols['variables'], dtype=np.int32)
+        clauses = np.asarray(cols['clauses'], dtype=np.int32)
+        
+        # Colonnes typées dès la construction: jamais de colonne object ni d'inférence
         data = {
-            'result': 'UNKNOWN',
-            'time': None,
-            'nodes': None
+            'filename': cols['filename'],
+            'variables': variables,
+            'clauses': clauses,
+            # Ratio calculé en bloc (0 si aucune variable)
+            'ratio_clauses_vars': np.divide(clauses, variables, out=np.zeros(len(variables)),
+                                            where=variables > 0)
         }
+        for solver in SOLVERS:
+            # Résultats SAT/UNSAT/TIMEOUT/UNKNOWN: codes int8 déjà calculés au parsing
+            codes = np.asarray(cols[f'{solver}_result'], dtype=np.int8)
+            data[f'{solver}_result'] = pd.Categorical.from_codes(codes, categories=RESULTS)
+            # None -> NaN (float64) / <NA> (Int64: un run CDCL peut dépasser 2^31 nœuds)
+            data[f'{solver}_time'] = np.asarray(cols[f'{solver}_time'], dtype=np.float64)
+            data[f'{solver}_nodes'] = pd.array(cols[f'{solver}_nodes'], dtype='Int64')
         
-        if 'TIMEOUT' in result_str:
-            data['result'] = 'TIMEOUT'
-            # Extraire le timeout
-            timeout_match = re.search(r'TIMEOUT \((\d+)s\)', result_str)
-            if timeout_match:
-                data['time'] = float(timeout_match.group(1))
-        elif 'SAT' in result_str or 'UNSAT' in result_str:
-            # Extraire SAT/UNSAT
-            if 'UNSAT' in result_str:
-                data['result'] = 'UNSAT'
-            else:
-                data['result'] = 'SAT'
-            
-            # Extraire le temps
-            time_match = re.search(r'(\d+\.\d+)s', result_str)
-            if time_match:
-                data['time'] = float(time_match.group(1))
-            
-            # Extraire les nœuds
-            nodes_match = re.search(r'Noeuds: (\d+)', result_str)
-            if nodes_match:
-                data['nodes'] = int(nodes_match.group(1))
-        
-        return data
-    
-    def create_dataframe(self):
-        """Créer un DataFrame pandas"""
-        self.df = pd.DataFrame(self.results)
+        self.df = pd.DataFrame(data, columns=COLUMNS)
+        self._df_built = True
         
-        print("\n📊 Aperçu des données:")
-        print(self.df.head(10))
-        print(f"\nShape: {self.df.shape}")
+        self._compute_masks()
+        
+        self._print_preview()
+        
+        return self.df
+    
+    def _print_preview(self):
+        """Aperçu du DataFrame (mode verbose uniquement)"""
+        if self.verbose:
+            print("\n📊 Aperçu des données:")
+            print(self.df.head(10))
+            print(f"\nShape: {self.df.shape}")
+    
+    def _compute_masks(self):
+        """Masque des instances résolues par CDCL, calculé une fois pour les graphiques"""
+        self.masks = {
+            'cdcl': {'solved': self.df['cdcl_result'].isin(['SAT', 'UNSAT']).to_numpy()}
+        }
+    
+    def load_or_parse(self, cache_file=None):
+        """
+        Charger le DataFrame depuis un cache Parquet s'il correspond encore au
+        fichier de résultats (même date de modification, même taille) et au
+        format courant (_CACHE_FORMAT), sinon parser le fichier et mettre le
+        cache à jour
+        """
+        source = Path(self.results_file)
+        if cache_file is None:
+            cache_file = source.with_name(f'.{source.stem}.parse_cache.parquet')
+        cache_file = Path(cache_file)
+        key_file = cache_file.with_suffix('.json')
+        
+        stat = source.stat()
+        key = {'source': source.name, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+               'format': _CACHE_FORMAT}
+        
+        try:
+            if cache_file.exists() and json.loads(key_file.read_text(encoding='utf-8')) == key:
+                self.df = pd.read_parquet(cache_file)
+                self._df_built = True
+                self._compute_masks()
+                print(f"✓ {len(self.df)} instances chargées depuis le cache: {cache_file}")
+                self._print_preview()
+                return self.df
+        except (OSError, ValueError, ImportError):
+            # Cache illisible ou moteur Parquet absent: on reparse
+            pass
+        
+        self.parse_results()
+        self.create_dataframe()
+        
+        try:
+            self.df.to_parquet(cache_file, index=False)
+            key_file.write_text(json.dumps(key), encoding='utf-8')
+        except (OSError, ImportError):
+            # Pas de pyarrow/fastparquet ou dossier en lecture seule: pas de cache
+            pass
         
         return self.df
     
@@ -121,7 +166,9 @@ class SATSolverResultsAnalyzer:
         if self.df is None:
             self.create_dataframe()
         
-        self.df.to_csv(output_file, index=False, encoding='utf-8')
+        # Format flottant fixe: pas de repr() Python par cellule
+        self.df.to_csv(output_file, index=False, encoding='utf-8',
+                       float_format='%.4f', lineterminator='\n')
         print(f"\n✓ CSV sauvegardé: {output_file}")
         
         return output_file
@@ -137,36 +184,50 @@ class SATSolverResultsAnalyzer:
         
         print("\n📊 INSTANCES:")
         print(f"  Total: {len(self.df)}")
-        print(f"  Variables: {self.df['variables'].min()} à {self.df['variables'].max()}")
-        print(f"  Clauses: {self.df['clauses'].min()} à {self.df['clauses'].max()}")
+        sizes = self.df[['variables', 'clauses']].agg(['min', 'max'])
+        print(f"  Variables: {sizes.at['min', 'variables']} à {sizes.at['max', 'variables']}")
+        print(f"  Clauses: {sizes.at['min', 'clauses']} à {sizes.at['max', 'clauses']}")
         print(f"  Ratio moyen clauses/variables: {self.df['ratio_clauses_vars'].mean():.2f}")
         
-        # NAIVE
-        print("\n🐌 NAIVE:")
-        naive_sat = (self.df['naive_result'] == 'SAT').sum()
-        naive_unsat = (self.df['naive_result'] == 'UNSAT').sum()
-        naive_timeout = (self.df['naive_result'] == 'TIMEOUT').sum()
-        print(f"  SAT: {naive_sat} | UNSAT: {naive_unsat} | TIMEOUT: {naive_timeout}")
-        if naive_sat + naive_unsat > 0:
-            print(f"  Temps moyen: {self.df[self.df['naive_result'].isin(['SAT', 'UNSAT'])]['naive_time'].mean():.2f}s")
-        
-        # MOMS
-        print("\n🧠 MOMS:")
-        moms_sat = (self.df['moms_result'] == 'SAT').sum()
-        moms_unsat = (self.df['moms_result'] == 'UNSAT').sum()
-        moms_timeout = (self.df['moms_result'] == 'TIMEOUT').sum()
-        print(f"  SAT: {moms_sat} | UNSAT: {moms_unsat} | TIMEOUT: {moms_timeout}")
-        if moms_sat + moms_unsat > 0:
-            print(f"  Temps moyen: {self.df[self.df['moms_result'].isin(['SAT', 'UNSAT'])]['moms_time'].mean():.2f}s")
-        
-        # CDCL
-        print("\n🚀 CDCL:")
-        cdcl_sat = (self.df['cdcl_result'] == 'SAT').sum()
-        cdcl_unsat = (self.df['cdcl_result'] == 'UNSAT').sum()
-        cdcl_timeout = (self.df['cdcl_result'] == 'TIMEOUT').sum()
-        print(f"  SAT: {cdcl_sat} | UNSAT: {cdcl_unsat} | TIMEOUT: {cdcl_timeout}")
-        print(f"  Temps moyen: {self.df[self.df['cdcl_result'].isin(['SAT', 'UNSAT'])]['cdcl_time'].mean():.2f}s")
-        print(f"  Nœuds moyens: {self.df[self.df['cdcl_nodes'].notna()]['cdcl_nodes'].mean():.0f}")
+        # Table longue (solveur, résultat, temps, nœuds) agrégée en une seule passe
+        long = pd.concat(
+            {solver: self.df[[f'{solver}_result', f'{solver}_time', f'{solver}_nodes']]
+                         .set_axis(['result', 'time', 'nodes'], axis=1)
+             for solver in SOLVERS},
+            names=['solver']
+        ).reset_index(level=0)
+        
+        sat = long['result'] == 'SAT'
+        unsat = long['result'] == 'UNSAT'
+        # Nœuds en float64 (NaN si absents): moyennes flottantes, jamais <NA>
+        long = long.assign(sat=sat, unsat=unsat, timeout=long['result'] == 'TIMEOUT',
+                           solved_time=long['time'].where(sat | unsat),
+                           nodes=long['nodes'].to_numpy(dtype=np.float64, na_value=np.nan))
+        stats = long.groupby('solver', sort=False).agg(
+            sat=('sat', 'sum'),
+            unsat=('unsat', 'sum'),
+            timeout=('timeout', 'sum'),
+            time_mean=('solved_time', 'mean'),
+            nodes_mean=('nodes', 'mean')
+        )
+        
+        headers = {'naive': '🐌 NAIVE:', 'moms': '🧠 MOMS:', 'cdcl': '🚀 CDCL:'}
+        for solver in SOLVERS:
+            # Lecture cellule par cellule: une ligne .loc mélangerait comptages
+            # entiers et moyennes et convertirait tout en flottants
+            n_sat = int(stats.at[solver, 'sat'])
+            n_unsat = int(stats.at[solver, 'unsat'])
+            n_timeout = int(stats.at[solver, 'timeout'])
+            print(f"\n{headers[solver]}")
+            print(f"  SAT: {n_sat} | UNSAT: {n_unsat} | TIMEOUT: {n_timeout}")
+            # Le temps moyen de CDCL est toujours affiché, avec ses nœuds moyens
+            if solver == 'cdcl' or n_sat + n_unsat > 0:
+                print(f"  Temps moyen: {float(stats.at[solver, 'time_mean']):.2f}s")
+            if solver == 'cdcl':
+                print(f"  Nœuds moyens: {float(stats.at[solver, 'nodes_mean']):.0f}")
+        
+        cdcl_sat = int(stats.at['cdcl', 'sat'])
+        cdcl_unsat = int(stats.at['cdcl', 'unsat'])
         
         # Comparaison
         print("\n⚡ COMPARAISON:")
@@ -177,8 +238,11 @@ class SATSolverResultsAnalyzer:
         
         print("="*70)
     
-    def plot_comprehensive_analysis(self):
-        """Générer tous les graphiques d'analyse"""
+    def plot_comprehensive_analysis(self, vector=False):
+        """
+        Générer tous les graphiques d'analyse.
+        Avec vector=True, la figure est enregistrée en PDF (vectoriel) au lieu du PNG.
+        """
         if self.df is None:
             self.create_dataframe()
         
@@ -186,75 +250,126 @@ class SATSolverResultsAnalyzer:
         plt.style.use('seaborn-v0_8-darkgrid')
         sns.set_palette("husl")
         
-        # Créer la figure avec 6 sous-graphiques
-        fig = plt.figure(figsize=(20, 12))
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        # Créer la figure et ses 9 sous-graphiques en un seul appel
+        # (mise en page 'constrained': pas de tight_layout ni de bbox_inches='tight')
+        fig, axes = plt.subplots(3, 3, figsize=(20, 12), layout='constrained')
+        ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9 = axes.flat
         
         fig.suptitle('Analyse Complète - SAT Solver Performance', 
-                     fontsize=18, fontweight='bold', y=0.995)
+                     fontsize=18, fontweight='bold')
+        
+        # Instances résolues par CDCL, filtrées et converties une seule fois
+        # (float32 pour le rendu uniquement: le DataFrame garde ses types)
+        solved = self.masks['cdcl']['solved']
+        df_cdcl = self.df[solved]
+        is_sat = (df_cdcl['cdcl_result'] == 'SAT').to_numpy()
+        arrays = _PlotArrays(
+            vars_=df_cdcl['variables'].to_numpy(dtype=np.float32),
+            clauses=df_cdcl['clauses'].to_numpy(dtype=np.float32),
+            time_=df_cdcl['cdcl_time'].to_numpy(dtype=np.float32),
+            nodes=df_cdcl['cdcl_nodes'].to_numpy(dtype=np.float32, na_value=np.nan),
+            ratio=df_cdcl['ratio_clauses_vars'].to_numpy(dtype=np.float32),
+            is_sat=is_sat,
+            is_unsat=~is_sat,
+            has_nodes=df_cdcl['cdcl_nodes'].notna().to_numpy()
+        )
+        # Catégories de taille et instances résolues par catégorie, partagées
+        # par les deux graphiques en barres
+        buckets = self._size_buckets(self.df['variables'].to_numpy())
+        solved_counts = self._size_counts(buckets[solved])
         
         # 1. Temps d'exécution CDCL vs Variables
-        ax1 = fig.add_subplot(gs[0, 0])
-        self._plot_cdcl_time_vs_vars(ax1)
+        self._plot_cdcl_time_vs_vars(ax1, arrays)
         
         # 2. Nœuds explorés vs Variables
-        ax2 = fig.add_subplot(gs[0, 1])
-        self._plot_cdcl_nodes_vs_vars(ax2)
+        self._plot_cdcl_nodes_vs_vars(ax2, arrays)
         
         # 3. Distribution SAT/UNSAT/TIMEOUT
-        ax3 = fig.add_subplot(gs[0, 2])
         self._plot_result_distribution(ax3)
         
         # 4. Temps CDCL: SAT vs UNSAT
-        ax4 = fig.add_subplot(gs[1, 0])
-        self._plot_sat_vs_unsat_time(ax4)
+        self._plot_sat_vs_unsat_time(ax4, arrays)
         
         # 5. Complexité: Log-Log (Temps vs Taille)
-        ax5 = fig.add_subplot(gs[1, 1])
-        self._plot_complexity_analysis(ax5)
+        self._plot_complexity_analysis(ax5, arrays)
         
         # 6. Ratio Clauses/Variables vs Temps
-        ax6 = fig.add_subplot(gs[1, 2])
-        self._plot_ratio_vs_time(ax6)
+        self._plot_ratio_vs_time(ax6, arrays)
         
         # 7. Performance par taille d'instance
-        ax7 = fig.add_subplot(gs[2, 0])
-        self._plot_performance_by_size(ax7)
+        self._plot_performance_by_size(ax7, arrays, buckets[solved], solved_counts)
         
         # 8. Nœuds: SAT vs UNSAT
-        ax8 = fig.add_subplot(gs[2, 1])
-        self._plot_nodes_comparison(ax8)
+        self._plot_nodes_comparison(ax8, arrays)
         
         # 9. Taux de succès par taille
-        ax9 = fig.add_subplot(gs[2, 2])
-        self._plot_success_rate(ax9)
-        
-        plt.tight_layout()
+        self._plot_success_rate(ax9, buckets, solved_counts)
         
         # Sauvegarder
-        output_file = '../Res/sat_solver_analysis.png'
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        output_file = '../Res/sat_solver_analysis.pdf' if vector else '../Res/sat_solver_analysis.png'
+        plt.savefig(output_file, dpi=_SAVE_DPI)
         print(f"\n✓ Graphique complet sauvegardé: {output_file}")
         
         plt.show()
     
-    def _plot_cdcl_time_vs_vars(self, ax):
+    def _scatter(self, ax, x, y, density=False, **kwargs):
+        """
+        Nuage de points rastérisé (sans bordure de marqueur pour les grands N).
+        Avec density=True (axes linéaires uniquement), les très grands nuages
+        sont agrégés en image de densité via datashader s'il est installé.
+        """
+        if density and ds is not None and len(x) > _DENSITY_SCATTER:
+            if self._density_image(ax, x, y, **kwargs):
+                return None
+        if len(x) > _LARGE_SCATTER:
+            kwargs['linewidths'] = 0
+        return ax.scatter(x, y, rasterized=True, **kwargs)
+    
+    def _density_image(self, ax, x, y, **kwargs):
+        """
+        Dessiner un nuage comme image de densité; False si impossible.
+        Les options de marqueur (c, s, alpha, label...) servent à la légende.
+        """
+        points = pd.DataFrame({
+            'x': np.asarray(x, dtype=np.float64),
+            'y': np.asarray(y, dtype=np.float64)
+        }).dropna()
+        x_range = (points['x'].min(), points['x'].max())
+        y_range = (points['y'].min(), points['y'].max())
+        if not (x_range[0] < x_range[1] and y_range[0] < y_range[1]):
+            return False
+        
+        # Une case par pixel du panneau à la résolution de sauvegarde
+        # (taille de l'axe avant la mise en page finale: approximation suffisante)
+        bbox = ax.get_window_extent()
+        scale = _SAVE_DPI / ax.figure.dpi
+        canvas = ds.Canvas(plot_width=max(1, int(bbox.width * scale)),
+                           plot_height=max(1, int(bbox.height * scale)),
+                           x_range=x_range, y_range=y_range)
+        agg = canvas.points(points, 'x', 'y')
+        # Une seule couleur: la densité est rendue par l'opacité, fond transparent;
+        # dynspread grossit les points isolés pour qu'ils restent visibles
+        img = tf.dynspread(tf.shade(agg, cmap=[kwargs.get('c', 'black')], how='log'),
+                           threshold=0.5, max_px=3)
+        
+        # Même transparence que les marqueurs: SAT et UNSAT restent visibles
+        ax.imshow(img.to_pil(), extent=(*x_range, *y_range), aspect='auto',
+                  alpha=kwargs.get('alpha'), interpolation='nearest')
+        # Marqueur vide pour conserver l'entrée de légende (mêmes options)
+        ax.scatter([], [], **kwargs)
+        return True
+    
+    def _plot_cdcl_time_vs_vars(self, ax, a):
         """Graphique: Temps CDCL vs Variables"""
-        df_cdcl = self.df[self.df['cdcl_result'].isin(['SAT', 'UNSAT'])]
-        
-        sat_data = df_cdcl[df_cdcl['cdcl_result'] == 'SAT']
-        unsat_data = df_cdcl[df_cdcl['cdcl_result'] == 'UNSAT']
-        
-        ax.scatter(sat_data['variables'], sat_data['cdcl_time'], 
-                  c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
-        ax.scatter(unsat_data['variables'], unsat_data['cdcl_time'], 
-                  c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
+        self._scatter(ax, a.vars_[a.is_sat], a.time_[a.is_sat], density=True,
+                      c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
+        self._scatter(ax, a.vars_[a.is_unsat], a.time_[a.is_unsat], density=True,
+                      c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
         
         # Régression
-        if len(df_cdcl) > 2:
-            z = np.polyfit(df_cdcl['variables'], df_cdcl['cdcl_time'], 2)
-            p = np.poly1d(z)
-            x_line = np.linspace(df_cdcl['variables'].min(), df_cdcl['variables'].max(), 100)
+        p = self._quadratic_fit(a.vars_, a.time_)
+        if p is not None:
+            x_line = np.linspace(a.vars_.min(), a.vars_.max(), 100)
             ax.plot(x_line, p(x_line), 'b--', linewidth=2, alpha=0.7, label='Régression')
         
         ax.set_xlabel('Nombre de Variables', fontsize=11, fontweight='bold')
@@ -263,28 +378,88 @@ class SATSolverResultsAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_cdcl_nodes_vs_vars(self, ax):
+    @staticmethod
+    def _quadratic_fit(x, y):
+        """
+        Régression de degré 2 par équations normales (système 3x3).
+        x est centré-réduit pour garder la matrice de Gram bien conditionnée.
+        Retourne le polynôme en x, ou None si moins de 3 points ou x constant.
+        """
+        if len(x) < 3:
+            return None
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        mu, sigma = x.mean(), x.std()
+        if sigma == 0:
+            return None
+        
+        t = (x - mu) / sigma
+        X = np.stack([t * t, t, np.ones_like(t)], axis=1)
+        try:
+            coef = np.linalg.solve(X.T @ X, X.T @ y)
+        except np.linalg.LinAlgError:
+            return None
+        
+        p = np.poly1d(coef)
+        return lambda v: p((np.asarray(v, dtype=np.float64) - mu) / sigma)
+    
+    @staticmethod
+    def _log10(values):
+        """log10 précalculé pour un axe linéaire; NaN (point ignoré) si valeur <= 0"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            logs = np.log10(values)
+        logs[~np.isfinite(logs)] = np.nan
+        return logs
+    
+    @staticmethod
+    def _decade_ticks(axis, logs):
+        """
+        Graduations d'un axe portant des log10, comme une échelle log:
+        majeures aux décades entières (10^k), mineures à log10(2..9).
+        Si les données couvrent moins de deux décades entières, les mineures
+        2 et 5 sont aussi étiquetées (2x10^k, 5x10^k).
+        """
+        axis.set_major_locator(MultipleLocator(1))
+        axis.set_major_formatter(FuncFormatter(lambda v, _: f'$10^{{{round(v)}}}$'))
+        
+        logs = logs[np.isfinite(logs)]
+        if len(logs) == 0:
+            return
+        lo, hi = logs.min(), logs.max()
+        decades = np.arange(np.floor(lo) - 1, np.ceil(hi) + 1)
+        axis.set_minor_locator(FixedLocator(
+            (decades[:, None] + np.log10(np.arange(2, 10))[None, :]).ravel()
+        ))
+        
+        if np.floor(hi) - np.ceil(lo) < 1:
+            def minor_label(v, _):
+                k = np.floor(v)
+                mantissa = round(10 ** (v - k))
+                return f'${mantissa}\\times10^{{{int(k)}}}$' if mantissa in (2, 5) else ''
+            axis.set_minor_formatter(FuncFormatter(minor_label))
+    
+    def _plot_cdcl_nodes_vs_vars(self, ax, a):
         """Graphique: Nœuds explorés vs Variables"""
-        df_cdcl = self.df[self.df['cdcl_nodes'].notna()]
-        
-        sat_data = df_cdcl[df_cdcl['cdcl_result'] == 'SAT']
-        unsat_data = df_cdcl[df_cdcl['cdcl_result'] == 'UNSAT']
-        
-        ax.scatter(sat_data['variables'], sat_data['cdcl_nodes'], 
-                  c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
-        ax.scatter(unsat_data['variables'], unsat_data['cdcl_nodes'], 
-                  c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
+        sat = a.is_sat & a.has_nodes
+        unsat = a.is_unsat & a.has_nodes
+        log_nodes = self._log10(a.nodes)
+        self._scatter(ax, a.vars_[sat], log_nodes[sat], 
+                      c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
+        self._scatter(ax, a.vars_[unsat], log_nodes[unsat], 
+                      c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
         
         ax.set_xlabel('Nombre de Variables', fontsize=11, fontweight='bold')
         ax.set_ylabel('Nœuds Explorés', fontsize=11, fontweight='bold')
         ax.set_title('CDCL: Nœuds vs Variables', fontsize=12, fontweight='bold')
-        ax.set_yscale('log')
+        self._decade_ticks(ax.yaxis, log_nodes[a.has_nodes])
         ax.legend()
         ax.grid(True, alpha=0.3)
     
     def _plot_result_distribution(self, ax):
         """Graphique: Distribution des résultats"""
         cdcl_counts = self.df['cdcl_result'].value_counts()
+        # Catégories fixes: ignorer les résultats absents
+        cdcl_counts = cdcl_counts[cdcl_counts > 0]
         
         colors = {'SAT': '#2ecc71', 'UNSAT': '#e74c3c', 'TIMEOUT': '#95a5a6'}
         colors_list = [colors.get(x, 'gray') for x in cdcl_counts.index]
@@ -303,19 +478,37 @@ class SATSolverResultsAnalyzer:
         ax.set_title('CDCL: Distribution des Résultats', fontsize=12, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
     
-    def _plot_sat_vs_unsat_time(self, ax):
+    @staticmethod
+    def _box_stats(values, label):
+        """
+        Statistiques d'une boîte pour ax.bxp (mêmes règles que ax.boxplot:
+        moustaches à 1.5 x IQR bornées aux données, points au-delà en fliers)
+        """
+        if len(values) == 0:
+            nan = float('nan')
+            return {'label': label, 'med': nan, 'q1': nan, 'q3': nan,
+                    'whislo': nan, 'whishi': nan, 'mean': nan, 'fliers': []}
+        
+        q1, med, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+        return {
+            'label': label,
+            'med': med, 'q1': q1, 'q3': q3,
+            'whislo': values[inside].min(), 'whishi': values[inside].max(),
+            'mean': values.mean(),
+            'fliers': values[~inside]
+        }
+    
+    def _plot_sat_vs_unsat_time(self, ax, a):
         """Graphique: Temps SAT vs UNSAT"""
-        df_cdcl = self.df[self.df['cdcl_result'].isin(['SAT', 'UNSAT'])]
+        sat_times = a.time_[a.is_sat]
+        unsat_times = a.time_[a.is_unsat]
         
-        sat_times = df_cdcl[df_cdcl['cdcl_result'] == 'SAT']['cdcl_time']
-        unsat_times = df_cdcl[df_cdcl['cdcl_result'] == 'UNSAT']['cdcl_time']
-        
-        data_to_plot = [sat_times, unsat_times]
-        labels = ['SAT', 'UNSAT']
+        stats = [self._box_stats(sat_times, 'SAT'), self._box_stats(unsat_times, 'UNSAT')]
         colors = ['#2ecc71', '#e74c3c']
         
-        bp = ax.boxplot(data_to_plot, labels=labels, patch_artist=True,
-                       showmeans=True, meanline=True)
+        bp = ax.bxp(stats, patch_artist=True, showmeans=True, meanline=True)
         
         for patch, color in zip(bp['boxes'], colors):
             patch.set_facecolor(color)
@@ -325,42 +518,30 @@ class SATSolverResultsAnalyzer:
         ax.set_title('CDCL: Temps SAT vs UNSAT', fontsize=12, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
     
-    def _plot_complexity_analysis(self, ax):
+    def _plot_complexity_analysis(self, ax, a):
         """Graphique: Analyse de complexité (Log-Log)"""
-        df_cdcl = self.df[self.df['cdcl_result'].isin(['SAT', 'UNSAT'])]
-        
-        total_size = df_cdcl['variables'] + df_cdcl['clauses']
-        
-        sat_data = df_cdcl[df_cdcl['cdcl_result'] == 'SAT']
-        unsat_data = df_cdcl[df_cdcl['cdcl_result'] == 'UNSAT']
+        log_size = self._log10(a.vars_ + a.clauses)
+        log_time = self._log10(a.time_)
         
-        sat_size = sat_data['variables'] + sat_data['clauses']
-        unsat_size = unsat_data['variables'] + unsat_data['clauses']
+        self._scatter(ax, log_size[a.is_sat], log_time[a.is_sat], 
+                      c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
+        self._scatter(ax, log_size[a.is_unsat], log_time[a.is_unsat], 
+                      c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
         
-        ax.scatter(sat_size, sat_data['cdcl_time'], 
-                  c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
-        ax.scatter(unsat_size, unsat_data['cdcl_time'], 
-                  c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
-        
-        ax.set_xscale('log')
-        ax.set_yscale('log')
+        self._decade_ticks(ax.xaxis, log_size)
+        self._decade_ticks(ax.yaxis, log_time)
         ax.set_xlabel('Taille Totale (Variables + Clauses)', fontsize=11, fontweight='bold')
         ax.set_ylabel('Temps (secondes)', fontsize=11, fontweight='bold')
         ax.set_title('Complexité: Log-Log Scale', fontsize=12, fontweight='bold')
         ax.legend()
         ax.grid(True, alpha=0.3, which='both')
     
-    def _plot_ratio_vs_time(self, ax):
+    def _plot_ratio_vs_time(self, ax, a):
         """Graphique: Ratio Clauses/Vars vs Temps"""
-        df_cdcl = self.df[self.df['cdcl_result'].isin(['SAT', 'UNSAT'])]
-        
-        sat_data = df_cdcl[df_cdcl['cdcl_result'] == 'SAT']
-        unsat_data = df_cdcl[df_cdcl['cdcl_result'] == 'UNSAT']
-        
-        ax.scatter(sat_data['ratio_clauses_vars'], sat_data['cdcl_time'], 
-                  c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
-        ax.scatter(unsat_data['ratio_clauses_vars'], unsat_data['cdcl_time'], 
-                  c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
+        self._scatter(ax, a.ratio[a.is_sat], a.time_[a.is_sat], density=True,
+                      c='green', s=100, alpha=0.6, label='SAT', edgecolors='black')
+        self._scatter(ax, a.ratio[a.is_unsat], a.time_[a.is_unsat], density=True,
+                      c='red', s=100, alpha=0.6, label='UNSAT', edgecolors='black')
         
         # Ligne verticale au seuil critique (4.26)
         ax.axvline(x=4.26, color='orange', linestyle='--', linewidth=2, 
@@ -372,40 +553,45 @@ class SATSolverResultsAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_performance_by_size(self, ax):
+    @staticmethod
+    def _size_buckets(variables):
+        """Indice de catégorie de taille par instance (len(_SIZE_LABELS) = hors bornes)"""
+        bucket = np.searchsorted(_SIZE_EDGES, variables, side='left') - 1
+        n_labels = len(_SIZE_LABELS)
+        bucket[(bucket < 0) | (bucket >= n_labels)] = n_labels
+        return bucket
+    
+    @staticmethod
+    def _size_counts(bucket, weights=None):
+        """Comptages (ou sommes pondérées) par catégorie de taille"""
+        n_labels = len(_SIZE_LABELS)
+        return np.bincount(bucket, weights=weights, minlength=n_labels + 1)[:n_labels]
+    
+    def _plot_performance_by_size(self, ax, a, bucket, counts):
         """Graphique: Performance par catégorie de taille"""
-        df_cdcl = self.df[self.df['cdcl_result'].isin(['SAT', 'UNSAT'])]
+        # Temps moyen par catégorie (bucket/counts: instances résolues par CDCL)
+        # Catégorie sans instance résolue: NaN, donc pas de barre (comme groupby().mean())
+        sums = self._size_counts(bucket, weights=a.time_)
+        avg_times = np.divide(sums, counts, out=np.full(len(_SIZE_LABELS), np.nan), where=counts > 0)
         
-        # Catégoriser par taille
-        bins = [0, 50, 100, 150, 200, 300]
-        labels = ['<50', '50-100', '100-150', '150-200', '>200']
-        df_cdcl['size_category'] = pd.cut(df_cdcl['variables'], bins=bins, labels=labels)
-        
-        # Temps moyen par catégorie
-        avg_times = df_cdcl.groupby('size_category')['cdcl_time'].mean()
-        
-        ax.bar(range(len(avg_times)), avg_times.values, 
+        ax.bar(range(len(avg_times)), avg_times, 
                color='steelblue', alpha=0.7, edgecolor='black', linewidth=2)
         ax.set_xticks(range(len(avg_times)))
-        ax.set_xticklabels(avg_times.index)
+        ax.set_xticklabels(_SIZE_LABELS)
         ax.set_xlabel('Catégorie de Taille (Variables)', fontsize=11, fontweight='bold')
         ax.set_ylabel('Temps Moyen (secondes)', fontsize=11, fontweight='bold')
         ax.set_title('Performance par Taille', fontsize=12, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
     
-    def _plot_nodes_comparison(self, ax):
+    def _plot_nodes_comparison(self, ax, a):
         """Graphique: Comparaison nœuds SAT vs UNSAT"""
-        df_cdcl = self.df[self.df['cdcl_nodes'].notna()]
-        
-        sat_nodes = df_cdcl[df_cdcl['cdcl_result'] == 'SAT']['cdcl_nodes']
-        unsat_nodes = df_cdcl[df_cdcl['cdcl_result'] == 'UNSAT']['cdcl_nodes']
+        sat_nodes = a.nodes[a.is_sat & a.has_nodes]
+        unsat_nodes = a.nodes[a.is_unsat & a.has_nodes]
         
-        data_to_plot = [sat_nodes, unsat_nodes]
-        labels = ['SAT', 'UNSAT']
+        stats = [self._box_stats(sat_nodes, 'SAT'), self._box_stats(unsat_nodes, 'UNSAT')]
         colors = ['#2ecc71', '#e74c3c']
         
-        bp = ax.boxplot(data_to_plot, labels=labels, patch_artist=True,
-                       showmeans=True, meanline=True)
+        bp = ax.bxp(stats, patch_artist=True, showmeans=True, meanline=True)
         
         for patch, color in zip(bp['boxes'], colors):
             patch.set_facecolor(color)
@@ -416,25 +602,15 @@ class SATSolverResultsAnalyzer:
         ax.set_yscale('log')
         ax.grid(True, alpha=0.3, axis='y')
     
-    def _plot_success_rate(self, ax):
+    def _plot_success_rate(self, ax, buckets, success):
         """Graphique: Taux de succès par taille"""
-        # Catégoriser
-        bins = [0, 50, 100, 150, 200, 300]
-        labels = ['<50', '50-100', '100-150', '150-200', '>200']
-        self.df['size_category'] = pd.cut(self.df['variables'], bins=bins, labels=labels)
-        
-        # Calculer taux de succès
-        success_rate = []
-        categories = []
-        
-        for cat in labels:
-            cat_data = self.df[self.df['size_category'] == cat]
-            if len(cat_data) > 0:
-                success = ((cat_data['cdcl_result'] == 'SAT') | 
-                          (cat_data['cdcl_result'] == 'UNSAT')).sum()
-                rate = 100 * success / len(cat_data)
-                success_rate.append(rate)
-                categories.append(cat)
+        # Taux de succès par catégorie (sans modifier self.df)
+        counts = self._size_counts(buckets)
+        
+        # Seules les catégories non vides sont affichées
+        present = counts > 0
+        success_rate = (100 * success[present] / counts[present]).tolist()
+        categories = [label for label, keep in zip(_SIZE_LABELS, present) if keep]
         
         colors_rate = ['#2ecc71' if r >= 80 else '#f39c12' if r >= 50 else '#e74c3c' 
                       for r in success_rate]
@@ -468,11 +644,8 @@ def main():
     # Créer l'analyseur
     analyzer = SATSolverResultsAnalyzer(results_file)
     
-    # Parser les résultats
-    analyzer.parse_results()
-    
-    # Créer le DataFrame
-    analyzer.create_dataframe()
+    # Parser les résultats et créer le DataFrame (réutilise le cache si à jour)
+    analyzer.load_or_parse()
     
     # Sauvegarder en CSV
     analyzer.save_to_csv()
@@ -1,6 +1,11 @@
-import random
 import os
+from itertools import combinations, product
 from pathlib import Path
+import numpy as np
+
+# Jusqu'à ce nombre de variables, toutes les clauses possibles sont énumérées
+# (C(10, 3) * 8 = 960 au plus) puis tirées sans remise
+ENUMERATE_MAX_VARS = 10
 
 class HardCNFGenerator:
     """
@@ -8,8 +13,10 @@ class HardCNFGenerator:
     Range: 5 à 200 variables (30 instances)
     """
     
-    def __init__(self):
+    def __init__(self, seed=None):
         self.instances = []
+        # Générateur numpy unique: les clauses sont tirées par lots
+        self.rng = np.random.default_rng(seed)
     
     def generate_hard_3sat(self, num_vars, ratio=4.26):
         """
@@ -18,6 +25,9 @@ class HardCNFGenerator:
         Args:
             num_vars: Nombre de variables (5-200)
             ratio: Ratio clauses/variables (4.26 = seuil critique pour 3-SAT)
+        
+        Returns:
+            (en-tête DIMACS, tableau numpy des clauses de forme (nb_clauses, 3))
         """
         num_clauses = int(num_vars * ratio)
         
@@ -28,42 +38,101 @@ class HardCNFGenerator:
         lines.append(f"c Ratio: {ratio:.2f} (critical threshold)")
         lines.append(f"p cnf {num_vars} {num_clauses}")
         
-        # Utiliser un set pour éviter les clauses dupliquées
-        clauses_set = set()
+        k = min(3, num_vars)  # Si moins de 3 vars, prendre toutes
+        
+        if num_vars <= ENUMERATE_MAX_VARS:
+            clauses = self._sample_all_clauses(num_vars, k, num_clauses)
+        else:
+            clauses = self._sample_random_clauses(num_vars, k, num_clauses)
+        
+        # Clauses gardées en tableau (ordre de tirage, déjà aléatoire):
+        # écrites en bloc par save_instances
+        return "\n".join(lines), clauses
+    
+    def _sample_all_clauses(self, num_vars, k, num_clauses):
+        """
+        Petites instances: énumère toutes les clauses non triviales de k
+        variables distinctes et en tire num_clauses sans remise (sans rejet)
+        """
+        var_sets = np.array(list(combinations(range(1, num_vars + 1), k)))
+        signs = np.array(list(product((1, -1), repeat=k)))
+        universe = (var_sets[:, None, :] * signs[None, :, :]).reshape(-1, k)
+        
+        # Si l'univers est plus petit que demandé, toutes les clauses sont prises
+        picked = self.rng.choice(len(universe), size=min(num_clauses, len(universe)), replace=False)
+        return universe[picked]
+    
+    def _sample_random_clauses(self, num_vars, k, num_clauses):
+        """
+        Grandes instances: tirages par lots, doublons écartés
+        (collisions rares, au plus num_clauses * 10 candidats)
+        """
+        # Clauses retenues (une ligne par clause), sans doublon
+        clauses = np.empty((0, k), dtype=np.int64)
         attempts = 0
         max_attempts = num_clauses * 10
         
-        while len(clauses_set) < num_clauses and attempts < max_attempts:
-            attempts += 1
+        while len(clauses) < num_clauses and attempts < max_attempts:
+            # Un lot de candidats par tour (2x les clauses manquantes)
+            batch = min(2 * (num_clauses - len(clauses)), max_attempts - attempts)
+            attempts += batch
             
-            # Choisir 3 variables DISTINCTES aléatoirement
-            k = min(3, num_vars)  # Si moins de 3 vars, prendre toutes
-            vars_in_clause = random.sample(range(1, num_vars + 1), k)
-            
-            # Assigner polarités aléatoires (50/50)
-            clause = tuple(
-                v if random.random() < 0.5 else -v 
-                for v in vars_in_clause
-            )
+            lits = self._random_clauses(num_vars, k, batch)
             
             # Éviter les clauses triviales (x ∨ ¬x ∨ y)
-            if not self._is_trivial_clause(clause):
-                clauses_set.add(clause)
+            lits = lits[~self._trivial_mask(lits)]
+            
+            # Éviter les doublons: première occurrence de chaque clé, dans
+            # l'ordre de tirage (les clauses déjà retenues restent en tête)
+            candidates = np.concatenate([clauses, lits])
+            _, first = np.unique(self._clause_keys(candidates), return_index=True)
+            clauses = candidates[np.sort(first)][:num_clauses]
+        
+        return clauses
+    
+    def _random_clauses(self, num_vars, k, count):
+        """
+        Tire `count` clauses de k littéraux par lots numpy:
+        k variables DISTINCTES par ligne et polarités aléatoires (50/50).
+        Mémoire en O(count * k), indépendante de num_vars.
+        """
+        vars_ = self.rng.integers(1, num_vars + 1, size=(count, k))
         
-        # Convertir en liste et mélanger
-        clauses_list = list(clauses_set)
-        random.shuffle(clauses_list)
+        # Retirer les seules lignes ayant une variable répétée (rares pour
+        # num_vars > ENUMERATE_MAX_VARS; les petites instances sont énumérées)
+        repeated = self._repeated_vars_mask(vars_)
+        while repeated.any():
+            vars_[repeated] = self.rng.integers(1, num_vars + 1, size=(np.count_nonzero(repeated), k))
+            repeated = self._repeated_vars_mask(vars_)
         
-        # Écrire les clauses
-        for clause in clauses_list:
-            lines.append(" ".join(map(str, clause)) + " 0")
+        signs = np.where(self.rng.random((count, k)) < 0.5, 1, -1)
+        return vars_ * signs
+    
+    def _repeated_vars_mask(self, vars_):
+        """Lignes où une même variable apparaît plusieurs fois"""
+        ordered = np.sort(vars_, axis=1)
+        return np.any(ordered[:, 1:] == ordered[:, :-1], axis=1)
+    
+    def _clause_keys(self, lits):
+        """
+        Clé uint64 d'une clause, indépendante de l'ordre des littéraux:
+        littéraux triés par variable, codés (var << 1) | négatif, 21 bits chacun
+        """
+        order = np.argsort(np.abs(lits), axis=1)
+        lits = np.take_along_axis(lits, order, axis=1)
+        codes = (np.abs(lits).astype(np.uint64) << np.uint64(1)) | (lits < 0).astype(np.uint64)
         
-        return "\n".join(lines)
+        keys = np.zeros(len(lits), dtype=np.uint64)
+        for j in range(lits.shape[1]):
+            keys = (keys << np.uint64(21)) | codes[:, j]
+        return keys
     
-    def _is_trivial_clause(self, clause):
-        """Vérifie si une clause contient x et ¬x (toujours vraie)"""
-        vars_set = set(abs(lit) for lit in clause)
-        return len(vars_set) < len(clause)
+    def _trivial_mask(self, lits):
+        """Lignes contenant x et ¬x (toujours vraies)"""
+        v = np.abs(lits)
+        same_var = v[:, :, None] == v[:, None, :]
+        opposite = np.sign(lits)[:, :, None] != np.sign(lits)[:, None, :]
+        return np.any(same_var & opposite, axis=(1, 2))
     
     def generate_progressive_instances(self, count=30, min_vars=5, max_vars=200):
         """
@@ -91,10 +160,11 @@ class HardCNFGenerator:
             ratio = 4.26
             num_clauses = int(num_vars * ratio)
             
-            instance = self.generate_hard_3sat(num_vars, ratio)
+            header, literals = self.generate_hard_3sat(num_vars, ratio)
             
             instances.append({
-                'content': instance,
+                'header': header,
+                'literals': literals,
                 'vars': num_vars,
                 'clauses': num_clauses,
                 'ratio': ratio,
@@ -125,9 +195,12 @@ class HardCNFGenerator:
             # Nom de fichier : generated_sat_XXX.cnf
             filename = f"{directory}/generated_sat_{i+1:03d}.cnf"
             
-            # Sauvegarder le fichier .cnf
+            # Sauvegarder le fichier .cnf (clauses terminées par 0, via savetxt)
+            literals = instance['literals']
+            terminated = np.column_stack([literals, np.zeros(len(literals), dtype=literals.dtype)])
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(instance['content'])
+                f.write(instance['header'] + "\n")
+                np.savetxt(f, terminated, fmt='%d')
             
             vars_count = instance['vars']
             clauses_count = instance['clauses']
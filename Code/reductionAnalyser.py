@@ -6,16 +6,57 @@ Analyse expérimentale de la croissance des variables et clauses
 après réduction SAT vers 3-SAT.
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
+import matplotlib
+# Sans affichage (serveur, SSH), utiliser le backend Agg non interactif
+if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+try:
+    # Optionnel : backend Polars (lecture paresseuse, agrégations en une passe)
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Colonnes du CSV de réduction (sans en-tête) et leurs types :
+# types explicites = pas d'inférence par colonne, moitié moins de mémoire
+COLUMN_DTYPES = {
+    "OriginalVars": "int32",
+    "OriginalClauses": "int32",
+    "Vars3SAT": "int32",
+    "Clauses3SAT": "int32",
+    "AuxVars": "int32",
+    "ClauseRatio": "float32",
+    "VarGrowth": "float32",
+    "Time": "float32"
+}
+
+# Statistiques affichées par analyze_complexity : (colonne, agrégation)
+SUMMARY_STATS = [
+    ("OriginalVars", "min"), ("OriginalVars", "max"),
+    ("OriginalClauses", "min"), ("OriginalClauses", "max"),
+    ("Vars3SAT", "min"), ("Vars3SAT", "max"),
+    ("Clauses3SAT", "min"), ("Clauses3SAT", "max"),
+    ("ClauseRatio", "mean"), ("VarGrowth", "mean"),
+    ("Time", "min"), ("Time", "max"), ("Time", "mean")
+]
+
 
 class ComplexityAnalyzerSAT3SAT:
 
-    def __init__(self, filepath):
+    def __init__(self, filepath, backend="pandas"):
+        if backend not in ("pandas", "polars"):
+            raise ValueError(f"Backend inconnu : {backend} (pandas ou polars)")
+        if backend == "polars" and pl is None:
+            raise ImportError("Le backend polars nécessite le paquet 'polars'")
+
         self.filepath = Path(filepath)
+        self.backend = backend
         self.df = None
 
         # 📂 Dossier de sortie pour les graphes
@@ -26,28 +67,35 @@ class ComplexityAnalyzerSAT3SAT:
         if not self.filepath.exists():
             raise FileNotFoundError(f"Fichier introuvable : {self.filepath}")
 
-        self.df = pd.read_csv(
-            self.filepath,
-            header=None,
-            names=[
-                "OriginalVars",
-                "OriginalClauses",
-                "Vars3SAT",
-                "Clauses3SAT",
-                "AuxVars",
-                "ClauseRatio",
-                "VarGrowth",
-                "Time"
-            ]
-        )
+        if self.backend == "polars":
+            schema = {col: getattr(pl, dtype.capitalize()) for col, dtype in COLUMN_DTYPES.items()}
+            self.df = pl.scan_csv(self.filepath, has_header=False, schema=schema).collect()
+        else:
+            self.df = pd.read_csv(
+                self.filepath,
+                header=None,
+                names=list(COLUMN_DTYPES),
+                dtype=COLUMN_DTYPES,
+                engine="c"
+            )
 
         print("✓ Données chargées avec succès")
         print("\nColonnes détectées :")
-        print(self.df.columns.tolist())
+        print(list(self.df.columns))
         print("\nAperçu des données :")
         print(self.df.head())
 
+    def _summary(self):
+        # Toutes les statistiques de SUMMARY_STATS, indexées "Colonne_agrégation"
+        if self.backend == "polars":
+            # Un seul select : Polars calcule toutes les agrégations en une passe
+            exprs = [getattr(pl.col(col), fn)().alias(f"{col}_{fn}") for col, fn in SUMMARY_STATS]
+            return self.df.select(exprs).row(0, named=True)
+        return {f"{col}_{fn}": getattr(self.df[col], fn)() for col, fn in SUMMARY_STATS}
+
     def analyze_complexity(self):
+        stats = self._summary()
+
         print("\n======================================================================")
         print("ANALYSE DE COMPLEXITÉ - RÉDUCTION SAT → 3-SAT")
         print("======================================================================")
@@ -56,66 +104,68 @@ class ComplexityAnalyzerSAT3SAT:
         print(f"  Instances analysées: {len(self.df)}")
         print(
             f"  Variables originales: "
-            f"{self.df['OriginalVars'].min()} à {self.df['OriginalVars'].max()}"
+            f"{stats['OriginalVars_min']} à {stats['OriginalVars_max']}"
         )
         print(
             f"  Clauses originales: "
-            f"{self.df['OriginalClauses'].min()} à {self.df['OriginalClauses'].max()}"
+            f"{stats['OriginalClauses_min']} à {stats['OriginalClauses_max']}"
         )
 
         print("\n📈 CROISSANCE OBSERVÉE:")
         print(
             f"  Variables après 3-SAT: "
-            f"{self.df['Vars3SAT'].min()} à {self.df['Vars3SAT'].max()}"
+            f"{stats['Vars3SAT_min']} à {stats['Vars3SAT_max']}"
         )
         print(
             f"  Clauses après 3-SAT: "
-            f"{self.df['Clauses3SAT'].min()} à {self.df['Clauses3SAT'].max()}"
+            f"{stats['Clauses3SAT_min']} à {stats['Clauses3SAT_max']}"
         )
 
         print("\n📐 RATIOS:")
-        print(f"  Ratio clauses moyen: {self.df['ClauseRatio'].mean():.3f}")
+        print(f"  Ratio clauses moyen: {stats['ClauseRatio_mean']:.3f}")
         print(
             f"  Facteur de croissance des variables moyen: "
-            f"{self.df['VarGrowth'].mean():.3f}"
+            f"{stats['VarGrowth_mean']:.3f}"
         )
 
         print("\n⏱️ TEMPS D'EXÉCUTION:")
-        print(f"  Temps min: {self.df['Time'].min():.3f}s")
-        print(f"  Temps max: {self.df['Time'].max():.3f}s")
-        print(f"  Temps moyen: {self.df['Time'].mean():.3f}s")
+        print(f"  Temps min: {stats['Time_min']:.3f}s")
+        print(f"  Temps max: {stats['Time_max']:.3f}s")
+        print(f"  Temps moyen: {stats['Time_mean']:.3f}s")
 
     def plot_growth(self):
         # 📊 Graphe 1 : Variables
-        plt.figure()
-        plt.scatter(self.df["OriginalVars"], self.df["Vars3SAT"])
-        plt.xlabel("Variables originales")
-        plt.ylabel("Variables après 3-SAT")
-        plt.title("Croissance des variables (SAT → 3-SAT)")
-        plt.grid(True)
-
-        vars_plot_path = self.plot_dir / "growth_variables_sat_3sat.png"
-        plt.savefig(vars_plot_path, dpi=300, bbox_inches="tight")
-        plt.show()
-        plt.close()
-
-        print(f"📁 Graphe enregistré : {vars_plot_path}")
+        self._plot_scatter(
+            "OriginalVars", "Vars3SAT",
+            "Variables originales", "Variables après 3-SAT",
+            "Croissance des variables (SAT → 3-SAT)",
+            "growth_variables_sat_3sat.png"
+        )
 
         # 📊 Graphe 2 : Clauses
-        plt.figure()
-        plt.scatter(self.df["OriginalClauses"], self.df["Clauses3SAT"])
-        plt.xlabel("Clauses originales")
-        plt.ylabel("Clauses après 3-SAT")
-        plt.title("Croissance des clauses (SAT → 3-SAT)")
-        plt.grid(True)
-
-        clauses_plot_path = self.plot_dir / "growth_clauses_sat_3sat.png"
-        plt.savefig(clauses_plot_path, dpi=300, bbox_inches="tight")
-        plt.show()
-        plt.close()
+        self._plot_scatter(
+            "OriginalClauses", "Clauses3SAT",
+            "Clauses originales", "Clauses après 3-SAT",
+            "Croissance des clauses (SAT → 3-SAT)",
+            "growth_clauses_sat_3sat.png"
+        )
 
-        print(f"📁 Graphe enregistré : {clauses_plot_path}")
+    def _plot_scatter(self, x_col, y_col, xlabel, ylabel, title, filename):
+        # Figure explicite, mise en page 'constrained' et 150 dpi :
+        # un seul rendu à l'enregistrement (pas de bbox_inches="tight")
+        fig, ax = plt.subplots(layout="constrained")
+        ax.scatter(self.df[x_col], self.df[y_col], rasterized=True)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.grid(True)
+
+        plot_path = self.plot_dir / filename
+        fig.savefig(plot_path, dpi=150)
+        plt.show()
+        plt.close(fig)
 
+        print(f"📁 Graphe enregistré : {plot_path}")
 
 def main():
     print("=" * 70)
@@ -0,0 +1,197 @@
+"""
+Parsing du log texte du SAT Solver (TerminalSolver.txt).
+Module volontairement léger (bibliothèque standard uniquement): les processus
+fils du parsing parallèle l'importent sans charger pandas ni matplotlib.
+"""
+
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+
+# Motifs compilés une seule fois au chargement du module
+_TIMEOUT_RE = re.compile(r'TIMEOUT \((\d+)s\)')
+_TIME_RE = re.compile(r'(\d+\.\d+)s')
+_NODES_RE = re.compile(r'Noeuds: (\d+)')
+
+# Solveurs dans l'ordre des phases du log ("[1/3] NAIVE... <résultat>")
+SOLVERS = ('naive', 'moms', 'cdcl')
+
+# Colonnes du DataFrame / CSV, dans l'ordre de sortie
+COLUMNS = [
+    'filename', 'variables', 'clauses', 'ratio_clauses_vars',
+    'naive_result', 'naive_time', 'naive_nodes',
+    'moms_result', 'moms_time', 'moms_nodes',
+    'cdcl_result', 'cdcl_time', 'cdcl_nodes'
+]
+# Colonnes remplies pendant le parsing (le ratio est calculé en bloc ensuite)
+PARSED_COLUMNS = [col for col in COLUMNS if col != 'ratio_clauses_vars']
+
+# Catégories fixes des colonnes *_result
+RESULTS = ['SAT', 'UNSAT', 'TIMEOUT', 'UNKNOWN']
+# Code de catégorie de chaque résultat (stocké au parsing, pas la chaîne)
+RESULT_CODES = {label: code for code, label in enumerate(RESULTS)}
+
+# En dessous de cette taille, le démarrage des processus coûte plus que le
+# parsing série (~0.1 s pour quelques Mo), même avec workers > 1
+PARALLEL_MIN_BYTES = 64 << 20
+# Tampon de lecture du log (le tampon par défaut de 8 Ko multiplie les appels système)
+_READ_BUFFER = 1 << 20
+
+
+class SolverLogParser:
+    """
+    Parse le log du SAT Solver en colonnes (une liste par champ)
+    """
+
+    def __init__(self, results_file):
+        self.results_file = results_file
+        # Stockage par colonne: une liste par champ, pas de dict par instance
+        self.results = {col: [] for col in PARSED_COLUMNS}
+
+    def parse(self, workers=1):
+        """
+        Parser le fichier texte de résultats, en série par défaut.
+        Avec workers > 1 (None: tous les cœurs), les très gros fichiers
+        (>= PARALLEL_MIN_BYTES) sont découpés aux lignes 'Fichier:' et
+        parsés en parallèle.
+        """
+        size = os.path.getsize(self.results_file)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if size < PARALLEL_MIN_BYTES or workers < 2:
+            with open(self.results_file, 'r', encoding='utf-8', buffering=_READ_BUFFER) as f:
+                self._scan(f)
+        else:
+            self._parse_parallel(size, workers)
+
+        return self.results
+
+    def _parse_parallel(self, size, workers):
+        """Parser des tranches du fichier alignées sur 'Fichier:' en parallèle"""
+        bounds = [0]
+        with open(self.results_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(1, workers):
+                pos = mm.find(b'\nFichier:', max(size * i // workers, bounds[-1]))
+                if pos < 0:
+                    break
+                bounds.append(pos + 1)
+        bounds.append(size)
+
+        with ProcessPoolExecutor(max_workers=len(bounds) - 1) as pool:
+            parts = pool.map(_parse_byte_range, repeat(self.results_file),
+                             bounds[:-1], bounds[1:])
+            # Les tranches reviennent dans l'ordre du fichier
+            for part in parts:
+                for col, values in part.items():
+                    self.results[col].extend(values)
+
+    def _scan(self, lines):
+        """Une seule passe ligne par ligne, aiguillée par le préfixe de chaque ligne"""
+        current = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            if line[0] == 'F' and line.startswith('Fichier:'):
+                self._add_entry(current)
+                current = {'filename': line[len('Fichier:'):].strip()}
+            elif current is None:
+                continue
+            elif line[0] == '[' and line[2:5] == '/3]' and '1' <= line[1] <= '3':
+                # Phase [N/3]: l'indice donne directement le solveur
+                solver = SOLVERS[int(line[1]) - 1]
+                current[solver] = self._parse_solver_result(line.partition('... ')[2])
+            elif 'Variables:' in line:
+                vars_part, _, clauses_part = line.partition('|')
+                current['variables'] = int(vars_part.partition(':')[2])
+                current['clauses'] = int(clauses_part.partition(':')[2])
+
+        self._add_entry(current)
+
+    def _add_entry(self, raw):
+        """Ajouter une instance complète (fichier, taille et 3 résultats)"""
+        required = ('filename', 'variables', 'clauses', 'naive', 'moms', 'cdcl')
+        if raw is None or any(key not in raw for key in required):
+            return
+        if not raw['filename'].endswith('.cnf'):
+            return
+
+        # Ajouter l'entrée colonne par colonne
+        cols = self.results
+        # Nom de base sans Path() par ligne (séparateurs Unix et Windows)
+        cols['filename'].append(raw['filename'].rpartition('/')[2].rpartition('\\')[2])
+        cols['variables'].append(raw['variables'])
+        cols['clauses'].append(raw['clauses'])
+
+        for solver in SOLVERS:
+            result, time, nodes = raw[solver]
+            cols[f'{solver}_result'].append(RESULT_CODES[result])
+            cols[f'{solver}_time'].append(time)
+            cols[f'{solver}_nodes'].append(nodes)
+
+    def _parse_solver_result(self, result_str):
+        """
+        Parser un résultat individuel (SAT/UNSAT/TIMEOUT).
+        Retourne le tuple (résultat, temps, nœuds); temps/nœuds à None si absents.
+        """
+        result = 'UNKNOWN'
+        time = None
+        nodes = None
+
+        # Un seul find par cas: la position sert aussi de départ aux regex
+        pos = result_str.find('TIMEOUT')
+        if pos >= 0:
+            result = 'TIMEOUT'
+            # Extraire le timeout
+            timeout_match = _TIMEOUT_RE.search(result_str, pos)
+            if timeout_match:
+                time = float(timeout_match.group(1))
+            return result, time, nodes
+
+        # Extraire SAT/UNSAT ('SAT' est contenu dans 'UNSAT')
+        pos = result_str.find('UNSAT')
+        if pos >= 0:
+            result = 'UNSAT'
+        else:
+            pos = result_str.find('SAT')
+            if pos >= 0:
+                result = 'SAT'
+
+        if pos >= 0:
+            # Chemin rapide: "SAT | 0.05s | Noeuds: 5835" (format fixe du solveur)
+            parts = result_str.partition('\n')[0].split(' | ')
+            try:
+                _, time_str, nodes_str = parts
+                return result, float(time_str.rstrip('s')), int(nodes_str.rpartition(': ')[2])
+            except ValueError:
+                pass
+
+            # Extraire le temps (après le résultat)
+            time_match = _TIME_RE.search(result_str, pos)
+            if time_match:
+                time = float(time_match.group(1))
+                pos = time_match.end()
+
+            # Extraire les nœuds (après le temps)
+            nodes_match = _NODES_RE.search(result_str, pos)
+            if nodes_match:
+                nodes = int(nodes_match.group(1))
+
+        return result, time, nodes
+
+
+def _parse_byte_range(results_file, start, end):
+    """Processus fils: parser la tranche [start, end) du fichier de résultats"""
+    with open(results_file, 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+
+    parser = SolverLogParser(results_file)
+    parser._scan(chunk.decode('utf-8').splitlines())
+    return parser.results